@@ -7,6 +7,7 @@ Extracts raw data from GitHub API and saves to bronze layer
 import argparse
 import sys
 import os
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime
 
 # Add src to path so we can import our modules
@@ -36,18 +37,22 @@ def main():
         from bronze.issues import extract_issues
         from bronze.commits import extract_commits
         
-        # Extract data in dependency order
-        print("\n📊 Step 1: Extracting repositories...")
-        repo_files = extract_repositories(client, config, use_cache=args.cache)
-        
-        print("\n👥 Step 2: Extracting organization members...")
-        member_files = extract_members(client, config, use_cache=args.cache)
-        
-        print("\n🐛 Step 3: Extracting issues and pull requests...")
-        issue_files = extract_issues(client, config, use_cache=args.cache)
-        
-        print("\n💾 Step 4: Extracting commits...")
-        commit_files = extract_commits(client, config, use_cache=args.cache)
+        # Extract data in dependency order; the extractors are network-bound
+        # on the GitHub API, so the independent ones run concurrently.
+        # Repositories go first and alone: members, issues and commits all
+        # read the filtered repository file (members as its empty-org
+        # fallback), so they only start once it is fully written
+        with ThreadPoolExecutor(max_workers=3) as executor:
+            print("\n📊 Step 1: Extracting repositories...")
+            repo_files = executor.submit(extract_repositories, client, config, use_cache=args.cache).result()
+
+            print("\n🐛 Step 2: Extracting members, issues, pull requests and commits...")
+            member_future = executor.submit(extract_members, client, config, use_cache=args.cache)
+            issue_future = executor.submit(extract_issues, client, config, use_cache=args.cache)
+            commit_future = executor.submit(extract_commits, client, config, use_cache=args.cache)
+            member_files = member_future.result()
+            issue_files = issue_future.result()
+            commit_files = commit_future.result()
         
         # Update registry
         all_files = repo_files + member_files + issue_files + commit_files
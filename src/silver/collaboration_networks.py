@@ -4,88 +4,139 @@ Collaboration networks processing for Silver layer
 Analyzes collaboration patterns and creates network metrics
 """
 
+import json
+import os
+import sys
 from collections import defaultdict
-from typing import List, Dict, Any, Set
-from utils.github_api import save_json_data, load_json_data
+from datetime import datetime
+from typing import Any, Dict, List, Set
+
+import numpy as np
+import pandas as pd
+
+from utils.github_api import save_json_data, iter_json_records
+
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+def _interned_pair(repo: str, login: Any) -> tuple:
+    """Intern both strings so duplicate logins/repo names share one object.
+
+    json parsing allocates a fresh str per occurrence; interning collapses
+    them so later set membership hits the pointer-equality fast path.
+    """
+    return (sys.intern(repo), sys.intern(login) if isinstance(login, str) else None)
+
+def _write_edges_stream(edge_weights: Dict[int, int], logins: List[str], filepath: str) -> str:
+    """Stream collaboration edges straight to disk, heaviest first.
+
+    Follows the save_json_data array convention (metadata header as the
+    first element) without ever materializing one dict per edge in memory.
+    """
+    os.makedirs(os.path.dirname(filepath), exist_ok=True)
+    dumps = orjson.dumps if orjson is not None else (lambda obj: json.dumps(obj).encode())
+
+    metadata = {
+        '_metadata': {
+            'extracted_at': datetime.now().isoformat(),
+            'file_path': filepath,
+            'record_count': len(edge_weights)
+        }
+    }
+
+    with open(filepath, 'wb') as f:
+        f.write(b'[\n')
+        f.write(dumps(metadata))
+        for edge_key, weight in sorted(edge_weights.items(), key=lambda kv: kv[1], reverse=True):
+            f.write(b',\n')
+            f.write(dumps({
+                'source': logins[edge_key >> 32],
+                'target': logins[edge_key & 0xFFFFFFFF],
+                'weight': weight,  # Weight = number of repos they collaborate on
+                'collaboration_type': 'same_repository'
+            }))
+        f.write(b'\n]')
+
+    print(f"✓ Saved data to: {filepath}")
+    return filepath
 
 def process_collaboration_networks() -> List[str]:
     """Process collaboration data into network metrics"""
     
-    # Load bronze data
-    issues_data = load_json_data("data/bronze/issues_all.json") or []
-    prs_data = load_json_data("data/bronze/prs_all.json") or []
-    commits_data = load_json_data("data/bronze/commits_all.json") or []
-    issue_events_data = load_json_data("data/bronze/issue_events_all.json") or []
-    
-    # Skip metadata entries
-    for data_list in [issues_data, prs_data, commits_data, issue_events_data]:
-        if isinstance(data_list, list) and len(data_list) > 0 and '_metadata' in data_list[0]:
-            data_list = data_list[1:]
-    
-    # Track collaborations by repository
-    repo_collaborators = defaultdict(set)
-    
-    # Collect contributors per repository
-    for issue in issues_data:
-        repo = issue.get('repo_name', 'unknown')
-        if issue.get('user', {}).get('login'):
-            repo_collaborators[repo].add(issue['user']['login'])
-        if issue.get('assignee', {}) and issue['assignee'].get('login'):
-            repo_collaborators[repo].add(issue['assignee']['login'])
-    
-    for pr in prs_data:
-        repo = pr.get('repo_name', 'unknown')
-        if pr.get('user', {}).get('login'):
-            repo_collaborators[repo].add(pr['user']['login'])
-    
-    for commit in commits_data:
-        repo = commit.get('repo_name', 'unknown')
-        if commit.get('author', {}) and commit['author'].get('login'):
-            repo_collaborators[repo].add(commit['author']['login'])
-    
-    for event in issue_events_data:
-        repo = event.get('repo_name', 'unknown')
-        if event.get('actor', {}) and event['actor'].get('login'):
-            repo_collaborators[repo].add(event['actor']['login'])
-    
-    # Create collaboration edges with weights
-    # Track all repo collaborations per user pair
-    collaboration_repos = defaultdict(list)
+    # Stream bronze records and project each one straight down to a
+    # (repo, login) pair so the raw record dicts never accumulate in memory,
+    # then build the contributor sets with a single vectorized groupby
+    pairs = (
+        [_interned_pair(issue.get('repo_name', 'unknown'), (who or {}).get('login'))
+         for issue in iter_json_records("data/bronze/issues_all.json")
+         for who in (issue.get('user'), issue.get('assignee'))]
+        + [_interned_pair(pr.get('repo_name', 'unknown'), (pr.get('user') or {}).get('login'))
+           for pr in iter_json_records("data/bronze/prs_all.json")]
+        + [_interned_pair(commit.get('repo_name', 'unknown'), (commit.get('author') or {}).get('login'))
+           for commit in iter_json_records("data/bronze/commits_all.json")]
+        + [_interned_pair(event.get('repo_name', 'unknown'), (event.get('actor') or {}).get('login'))
+           for event in iter_json_records("data/bronze/issue_events_all.json")]
+    )
+
+    contributions_df = pd.DataFrame(pairs, columns=['repo', 'login']).dropna(subset=['login'])
+
+    # Contributors per repository, and the inverted mapping: which repos has
+    # each user touched? The contributor sets are written once and only read
+    # afterwards, so freeze them for denser storage and cheaper iteration
+    repo_collaborators = contributions_df.groupby('repo')['login'].agg(frozenset).to_dict()
+    user_to_repos = contributions_df.groupby('login')['repo'].agg(set).to_dict()
+
+    # Integer-encode logins so hot-loop edge keys are single machine ints
+    # (packed (min << 32) | max) instead of tuples of freshly-hashed strings
+    logins = list(user_to_repos)
+    login_index = {login: idx for idx, login in enumerate(logins)}
+
+    # Encode each user's repo membership as a bitmask over repo indices:
+    # an edge weight is then one C-level AND plus popcount
+    repo_ids = {repo: idx for idx, repo in enumerate(repo_collaborators)}
+    user_masks = [0] * len(logins)
+    for login, repos in user_to_repos.items():
+        mask = 0
+        for repo in repos:
+            mask |= 1 << repo_ids[repo]
+        user_masks[login_index[login]] = mask
+
+    # Every pair inside a repo's clique shares that repo, so the number of
+    # edges touching it is exactly C(k, 2) — one expression per repo instead
+    # of an increment per pair visit or a rescan of all edges per repo
+    repo_edge_counts = {
+        repo: len(contributors) * (len(contributors) - 1) // 2
+        for repo, contributors in repo_collaborators.items()
+    }
+
+    # Create collaboration edges with weights, resolving each pair once
+    edge_weights = {}
     user_collaborations = defaultdict(set)
 
     for repo, contributors in repo_collaborators.items():
-        contributors_list = list(contributors)
+        contributor_ids = tuple(login_index[user] for user in contributors)
 
         # Create edges between all contributors in the same repo
-        for i, user1 in enumerate(contributors_list):
-            for user2 in contributors_list[i+1:]:
-                if user1 != user2:
-                    # Create bidirectional edge key
-                    edge_key = tuple(sorted([user1, user2]))
-                    collaboration_repos[edge_key].append(repo)
-
+        for i, id1 in enumerate(contributor_ids):
+            for id2 in contributor_ids[i+1:]:
+                # Create bidirectional edge key
+                edge_key = (id1 << 32) | id2 if id1 < id2 else (id2 << 32) | id1
+                if edge_key not in edge_weights:
+                    edge_weights[edge_key] = (user_masks[id1] & user_masks[id2]).bit_count()
+                    user1 = logins[id1]
+                    user2 = logins[id2]
                     user_collaborations[user1].add(user2)
                     user_collaborations[user2].add(user1)
 
-    # Convert to edge format with weights
-    collaboration_edges = []
-    for (source, target), repos in collaboration_repos.items():
-        collaboration_edges.append({
-            'source': source,
-            'target': target,
-            'weight': len(repos),  # Weight = number of repos they collaborate on
-            'repos': repos,
-            'collaboration_type': 'same_repository'
-        })
-
-    # Sort by weight descending
-    collaboration_edges.sort(key=lambda x: x['weight'], reverse=True)
-
     generated_files = []
 
-    # Save collaboration edges
-    edges_file = save_json_data(
-        collaboration_edges,
+    # Save collaboration edges, sorted by weight descending and streamed
+    # to disk so peak memory stays at the compact weight map
+    edges_file = _write_edges_stream(
+        edge_weights,
+        logins,
         "data/silver/collaboration_edges.json"
     )
     generated_files.append(edges_file)
@@ -97,14 +148,15 @@ def process_collaboration_networks() -> List[str]:
             'user': user,
             'collaborator_count': len(collaborators),
             'collaborators': list(collaborators),
-            'repositories_contributed': len([repo for repo, contributors in repo_collaborators.items() if user in contributors])
+            'repositories_contributed': len(user_to_repos[user])
         })
     
     user_metrics.sort(key=lambda x: x['collaborator_count'], reverse=True)
     
     user_metrics_file = save_json_data(
         user_metrics,
-        "data/silver/user_collaboration_metrics.json"
+        "data/silver/user_collaboration_metrics.json",
+        pretty=False
     )
     generated_files.append(user_metrics_file)
     
@@ -115,7 +167,7 @@ def process_collaboration_networks() -> List[str]:
 
         # Calculate potential and actual collaborations
         potential_collaborations = len(contributors_list) * (len(contributors_list) - 1) // 2
-        actual_collaborations = len([e for e in collaboration_edges if repo in e['repos']])
+        actual_collaborations = repo_edge_counts.get(repo, 0)
 
         repo_analysis.append({
             'repo': repo,
@@ -130,14 +182,15 @@ def process_collaboration_networks() -> List[str]:
     
     repo_analysis_file = save_json_data(
         repo_analysis,
-        "data/silver/repository_collaboration_analysis.json"
+        "data/silver/repository_collaboration_analysis.json",
+        pretty=False
     )
     generated_files.append(repo_analysis_file)
     
     # Identify cross-repository collaborators (hubs)
     cross_repo_contributors = {}
     for user in user_collaborations.keys():
-        repos_contributed = [repo for repo, contributors in repo_collaborators.items() if user in contributors]
+        repos_contributed = sorted(user_to_repos[user])
         if len(repos_contributed) > 1:
             cross_repo_contributors[user] = {
                 'user': user,
@@ -152,23 +205,35 @@ def process_collaboration_networks() -> List[str]:
         
         cross_repo_file = save_json_data(
             cross_repo_list,
-            "data/silver/cross_repository_hubs.json"
+            "data/silver/cross_repository_hubs.json",
+            pretty=False
         )
         generated_files.append(cross_repo_file)
     
     # Create network summary statistics
+    # Cardinalities go through a pre-sized int array so the reductions run in C
+    collaborator_counts = np.fromiter(
+        (len(collaborators) for collaborators in user_collaborations.values()),
+        dtype=np.int64, count=len(user_collaborations)
+    )
+    contributor_counts = np.fromiter(
+        (len(contributors) for contributors in repo_collaborators.values()),
+        dtype=np.int64, count=len(repo_collaborators)
+    )
+
     network_stats = {
         'total_users': len(user_collaborations),
-        'total_collaborations': len(collaboration_edges),
+        'total_collaborations': len(edge_weights),
         'total_repositories': len(repo_collaborators),
         'cross_repo_contributors': len(cross_repo_contributors),
-        'avg_collaborators_per_user': sum(len(collaborators) for collaborators in user_collaborations.values()) / len(user_collaborations) if user_collaborations else 0,
-        'avg_contributors_per_repo': sum(len(contributors) for contributors in repo_collaborators.values()) / len(repo_collaborators) if repo_collaborators else 0
+        'avg_collaborators_per_user': float(collaborator_counts.mean()) if collaborator_counts.size else 0,
+        'avg_contributors_per_repo': float(contributor_counts.mean()) if contributor_counts.size else 0
     }
     
     stats_file = save_json_data(
         network_stats,
-        "data/silver/network_statistics.json"
+        "data/silver/network_statistics.json",
+        pretty=False
     )
     generated_files.append(stats_file)
     
@@ -90,7 +90,8 @@ def process_contribution_metrics() -> List[str]:
     # Save contribution metrics
     contrib_file = save_json_data(
         contribution_list,
-        "data/silver/contribution_metrics.json"
+        "data/silver/contribution_metrics.json",
+        pretty=False
     )
     generated_files.append(contrib_file)
     
@@ -137,7 +138,8 @@ def process_contribution_metrics() -> List[str]:
     # Save repository metrics
     repo_file = save_json_data(
         repo_list,
-        "data/silver/repository_metrics.json"
+        "data/silver/repository_metrics.json",
+        pretty=False
     )
     generated_files.append(repo_file)
     
@@ -160,7 +162,8 @@ def process_contribution_metrics() -> List[str]:
         
         distribution_file = save_json_data(
             distribution_analysis,
-            "data/silver/contribution_distribution.json"
+            "data/silver/contribution_distribution.json",
+            pretty=False
         )
         generated_files.append(distribution_file)
     
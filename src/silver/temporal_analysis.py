@@ -108,7 +108,8 @@ def process_temporal_analysis() -> List[str]:
     # Save all temporal events
     events_file = save_json_data(
         [{**event, 'date': event['date'].isoformat()} for event in all_events],
-        "data/silver/temporal_events.json"
+        "data/silver/temporal_events.json",
+        pretty=False
     )
     generated_files.append(events_file)
     
@@ -157,7 +158,8 @@ def process_temporal_analysis() -> List[str]:
     
     daily_file = save_json_data(
         daily_summary,
-        "data/silver/daily_activity_summary.json"
+        "data/silver/daily_activity_summary.json",
+        pretty=False
     )
     generated_files.append(daily_file)
     
@@ -181,7 +183,8 @@ def process_temporal_analysis() -> List[str]:
     
     heatmap_file = save_json_data(
         heatmap_data,
-        "data/silver/activity_heatmap.json"
+        "data/silver/activity_heatmap.json",
+        pretty=False
     )
     generated_files.append(heatmap_file)
     
@@ -225,7 +228,8 @@ def process_temporal_analysis() -> List[str]:
     if cycle_times:
         cycle_times_file = save_json_data(
             cycle_times,
-            "data/silver/cycle_times.json"
+            "data/silver/cycle_times.json",
+            pretty=False
         )
         generated_files.append(cycle_times_file)
     
@@ -264,7 +268,8 @@ def process_temporal_analysis() -> List[str]:
         
         stats_file = save_json_data(
             temporal_stats,
-            "data/silver/temporal_statistics.json"
+            "data/silver/temporal_statistics.json",
+            pretty=False
         )
         generated_files.append(stats_file)
     
@@ -7,6 +7,7 @@ Transforms bronze raw data into analytics-ready formats
 import argparse
 import sys
 import os
+from concurrent.futures import ProcessPoolExecutor, as_completed
 from datetime import datetime
 
 # Add src to path so we can import our modules
@@ -17,34 +18,52 @@ from utils.github_api import update_data_registry
 def main():
     parser = argparse.ArgumentParser(description='Process Bronze data to Silver layer')
     parser.add_argument('--org', default='coops-org', help='GitHub organization name')
-    
+    parser.add_argument('--only', default='all',
+                        help='Comma-separated subset of processors to run '
+                             '(members,contrib,collab,temporal); default: all')
+
     args = parser.parse_args()
-    
+
+    selected = {name.strip() for name in args.only.split(',')}
+    run_all = 'all' in selected
+
     print(f"🔄 Starting Silver layer processing")
     print(f"📅 Started at: {datetime.now().isoformat()}")
     
     try:
-        # Import and run individual processors
-        from silver.member_analytics import process_member_analytics
-        from silver.contribution_metrics import process_contribution_metrics
-        from silver.collaboration_networks import process_collaboration_networks
-        from silver.temporal_analysis import process_temporal_analysis
-        
-        # Process data in logical order
-        print("\n👥 Step 1: Processing member analytics...")
-        member_files = process_member_analytics()
-        
-        print("\n📊 Step 2: Processing contribution metrics...")
-        contrib_files = process_contribution_metrics()
-        
-        print("\n🤝 Step 3: Processing collaboration networks...")
-        collab_files = process_collaboration_networks()
-        
-        print("\n📅 Step 4: Processing temporal analysis...")
-        temporal_files = process_temporal_analysis()
-        
+        # Import each processor module only when selected, so a run like
+        # --only collab never pays the startup cost of the other modules
+        processors = []
+        if run_all or 'members' in selected:
+            from silver.member_analytics import process_member_analytics
+            processors.append(('member analytics', process_member_analytics))
+        if run_all or 'contrib' in selected:
+            from silver.contribution_metrics import process_contribution_metrics
+            processors.append(('contribution metrics', process_contribution_metrics))
+        if run_all or 'collab' in selected:
+            from silver.collaboration_networks import process_collaboration_networks
+            processors.append(('collaboration networks', process_collaboration_networks))
+        if run_all or 'temporal' in selected:
+            from silver.temporal_analysis import process_temporal_analysis
+            processors.append(('temporal analysis', process_temporal_analysis))
+
+        if not processors:
+            print(f"❌ Unknown processor selection: {args.only}")
+            sys.exit(1)
+
+        # The processors read disjoint bronze files and write disjoint silver
+        # files, so they run concurrently in separate processes
+        print("\n⚙️ Processing all silver datasets in parallel...")
+        results = {}
+        with ProcessPoolExecutor(max_workers=len(processors)) as executor:
+            futures = {executor.submit(processor): name for name, processor in processors}
+            for future in as_completed(futures):
+                name = futures[future]
+                results[name] = future.result()
+                print(f"   ✓ Finished {name}")
+
         # Update registry
-        all_files = member_files + contrib_files + collab_files + temporal_files
+        all_files = [f for name, _ in processors for f in results[name]]
         update_data_registry('silver', 'all_processed', all_files)
         
         print(f"\n✅ Silver processing completed successfully!")
@@ -1,12 +1,13 @@
 # Utils Package
 # Shared utilities and helpers
 
-from .github_api import GitHubAPIClient, OrganizationConfig, save_json_data, load_json_data, update_data_registry
+from .github_api import GitHubAPIClient, OrganizationConfig, save_json_data, load_json_data, iter_json_records, update_data_registry
 
 __all__ = [
     'GitHubAPIClient',
     'OrganizationConfig',
     'save_json_data',
-    'load_json_data', 
+    'load_json_data',
+    'iter_json_records',
     'update_data_registry'
 ]
\ No newline at end of file
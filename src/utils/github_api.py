@@ -11,6 +11,16 @@ import requests
 from datetime import datetime
 from typing import Dict, List, Optional, Any
 
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+try:
+    import ijson
+except ImportError:
+    ijson = None
+
 class GitHubAPIClient:
     def __init__(self, token: str, cache_dir: str = "cache"):
         self.token = token
@@ -91,8 +101,13 @@ class GitHubAPIClient:
         else:
             print(f"Rate limit: {remaining}/{limit}")
 
-def save_json_data(data: Any, filepath: str, timestamp: bool = True) -> str:
-    """Save data to JSON file with optional timestamp"""
+def save_json_data(data: Any, filepath: str, timestamp: bool = True,
+                   pretty: bool = True) -> str:
+    """Save data to JSON file with optional timestamp.
+
+    pretty=False drops indentation; the large silver/gold outputs are only
+    read back by code, so they skip the whitespace bytes.
+    """
     os.makedirs(os.path.dirname(filepath), exist_ok=True)
     
     if timestamp:
@@ -113,9 +128,21 @@ def save_json_data(data: Any, filepath: str, timestamp: bool = True) -> str:
             }
             data = [metadata] + data
     
-    with open(filepath, 'w', encoding='utf-8') as f:
-        json.dump(data, f, indent=2, ensure_ascii=False)
-    
+    if orjson is not None:
+        # OPT_SERIALIZE_NUMPY lets the vectorized silver processors hand
+        # over numpy scalars/arrays without a Python-level conversion pass
+        option = orjson.OPT_SERIALIZE_NUMPY
+        if pretty:
+            option |= orjson.OPT_INDENT_2
+        with open(filepath, 'wb') as f:
+            f.write(orjson.dumps(data, option=option))
+    else:
+        with open(filepath, 'w', encoding='utf-8') as f:
+            if pretty:
+                json.dump(data, f, indent=2, ensure_ascii=False)
+            else:
+                json.dump(data, f, separators=(',', ':'), ensure_ascii=False)
+
     print(f"✓ Saved data to: {filepath}")
     return filepath
 
@@ -123,10 +150,36 @@ def load_json_data(filepath: str) -> Any:
     """Load data from JSON file"""
     if not os.path.exists(filepath):
         return None
-    
+
+    if orjson is not None:
+        with open(filepath, 'rb') as f:
+            return orjson.loads(f.read())
+
     with open(filepath, 'r', encoding='utf-8') as f:
         return json.load(f)
 
+def iter_json_records(filepath: str) -> Any:
+    """Yield records from a JSON array file one at a time.
+
+    Uses ijson incremental parsing when available so the whole file is never
+    materialized at once; falls back to a full load otherwise. The metadata
+    header entry is skipped either way.
+    """
+    if ijson is not None:
+        if not os.path.exists(filepath):
+            return
+        with open(filepath, 'rb') as f:
+            records = ijson.items(f, 'item')
+            first = next(records, None)
+            if first is not None and '_metadata' not in first:
+                yield first
+            yield from records
+    else:
+        records = load_json_data(filepath) or []
+        if len(records) > 0 and '_metadata' in records[0]:
+            records = records[1:]
+        yield from records
+
 def update_data_registry(layer: str, entity: str, files: List[str]) -> None:
     """Update the data registry with new files"""
     registry_path = f"data/{layer}/registry.json"